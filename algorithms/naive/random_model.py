@@ -2,6 +2,11 @@
 Model that returns purely random actions.
 """
 
+import copy
+
+import numpy as np
+from gymnasium.spaces import Box
+
 from algorithms.model import Model
 
 
@@ -9,19 +14,78 @@ class RandomModel(Model):
     """
     Model that returns purely random actions.
 
-    The actions are based on the :py:attr:`~smartgrid.environment.SmartGrid.action_space`
-    for each agent, using the :py:meth:`Space.sample() <gymnasium.spaces.space.Space.sample>`
-    method.
+    The actions are drawn uniformly from the
+    :py:attr:`~smartgrid.environment.SmartGrid.action_space` of each agent.
+    When all agents use bounded :py:class:`~gymnasium.spaces.Box` spaces of
+    the same shape and dtype (which is the case in the provided scenarii),
+    actions for all agents are drawn at once, with a single call to the
+    random generator. Otherwise, the
+    :py:meth:`Space.sample() <gymnasium.spaces.space.Space.sample>` method
+    is used for each agent, on a copy of its action space (so that the
+    environment's spaces are not reseeded).
+
+    List of hyperparameters that this model accepts:
+
+    seed
+        Optional seed, to make the actions reproducible. When actions cannot
+        be drawn at once, it is used to seed the copies of the agents'
+        action spaces. If not given (or ``None``), the generator is seeded from fresh
+        entropy, and actions are not reproducible.
     """
 
-    def __init__(self, env, hyper_parameters: dict):
+    def __init__(self, env, hyper_parameters: dict = None):
+        if hyper_parameters is None:
+            hyper_parameters = {}
         super().__init__(env, hyper_parameters)
+        self._rng = np.random.default_rng(hyper_parameters.get('seed'))
+        self._agents_names = list(env.agents)
+        spaces = [env.action_space(name) for name in self._agents_names]
+        if self._can_stack(spaces):
+            self._dtype = spaces[0].dtype
+            self._is_integer = np.issubdtype(self._dtype, np.integer)
+            self._low = np.stack([s.low for s in spaces]).astype(np.float64)
+            self._high = np.stack([s.high for s in spaces]).astype(np.float64)
+            if self._is_integer:
+                # Drawing in `[low, high+1)` and flooring gives integers
+                # in `[low, high]`, similarly to `Box.sample()`.
+                self._high += 1
+        else:
+            self._low = None
+            self._high = None
+            # Spaces may be shared by several agents, and belong to the env:
+            # we sample from our own copies, each seeded from our generator,
+            # so that a single seed makes all agents' actions reproducible.
+            self._spaces = {}
+            for name, space in zip(self._agents_names, spaces):
+                space = copy.deepcopy(space)
+                space.seed(int(self._rng.integers(2 ** 32)))
+                self._spaces[name] = space
 
     def forward(self, observations_per_agent):
-        actions = {}
-        for agent_name in self.env.agents:
-            actions[agent_name] = self.env.action_space(agent_name).sample()
-        return actions
+        if self._low is None:
+            return {
+                agent_name: self._spaces[agent_name].sample()
+                for agent_name in self._agents_names
+            }
+        actions = self._rng.uniform(self._low, self._high)
+        if self._is_integer:
+            actions = np.floor(actions)
+        actions = actions.astype(self._dtype)
+        return dict(zip(self._agents_names, actions))
 
     def backward(self, observations_per_agent, reward_per_agent):
         pass
+
+    @staticmethod
+    def _can_stack(spaces) -> bool:
+        """Whether actions for all these spaces can be drawn at once."""
+        if len(spaces) == 0:
+            return False
+        first = spaces[0]
+        return all(
+            isinstance(space, Box)
+            and space.is_bounded()
+            and space.shape == first.shape
+            and space.dtype == first.dtype
+            for space in spaces
+        )
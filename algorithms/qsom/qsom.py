@@ -75,6 +75,22 @@ class QSOM(Model):
     use_neighborhood
         Whether to use the State- and Action-SOMs neighborhoods when updating
         the Q-Values.
+
+    som_dtype
+        The NumPy dtype of the State- and Action-SOMs' units, e.g.,
+        ``'float32'`` to halve the memory used by the maps, at the cost of
+        precision.
+
+    max_experiences
+        The maximum number of experiences that each agent keeps in its
+        ``experiences`` log (a :py:class:`collections.deque`, which does not
+        support slicing); older experiences are discarded. Use ``None`` to
+        keep all of them.
+
+    Hyperparameters that are not given to the constructor take their value
+    from :py:attr:`.default_hyperparameters`; it is thus possible to specify
+    only those that differ from the defaults, e.g.,
+    ``QSOM(env, {'q_learning_rate': 0.1})``.
     """
 
     default_hyperparameters = {
@@ -89,12 +105,17 @@ class QSOM(Model):
         "initial_tau": 0.5,
         "tau_decay": False,
         "tau_decay_coeff": 1.0,
-        "noise": 0.08
+        "noise": 0.08,
+        "som_dtype": "float64",
+        "max_experiences": 10_000,
     }
 
     def __init__(self, env: SmartGrid, hyper_parameters: dict = None):
+        # Hyper-parameters that are not specified fall back to their default
+        # value, so that experiments only need to declare what they change.
         if hyper_parameters is None:
-            hyper_parameters = QSOM.default_hyperparameters
+            hyper_parameters = {}
+        hyper_parameters = {**QSOM.default_hyperparameters, **hyper_parameters}
         super().__init__(env, hyper_parameters)
         self.qsom_agents = {}
 
@@ -112,11 +133,13 @@ class QSOM(Model):
             state_som = SOM(12, 12,
                             obs_space.shape[0],
                             sigma=self.hyper_parameters["sigma_state"],
-                            learning_rate=self.hyper_parameters["lr_state"])
+                            learning_rate=self.hyper_parameters["lr_state"],
+                            dtype=self.hyper_parameters["som_dtype"])
             action_som = SOM(3, 3,
                              action_space.shape[0],
                              sigma=self.hyper_parameters["sigma_action"],
-                             learning_rate=self.hyper_parameters["lr_action"])
+                             learning_rate=self.hyper_parameters["lr_action"],
+                             dtype=self.hyper_parameters["som_dtype"])
 
             qsom_agent = QsomAgent(obs_space,
                                    action_space,
@@ -127,13 +150,15 @@ class QSOM(Model):
                                    q_learning_rate=self.hyper_parameters["q_learning_rate"],
                                    q_discount_factor=self.hyper_parameters["q_discount_factor"],
                                    update_all=self.hyper_parameters["update_all"],
-                                   use_neighborhood=self.hyper_parameters["use_neighborhood"])
+                                   use_neighborhood=self.hyper_parameters["use_neighborhood"],
+                                   max_experiences=self.hyper_parameters["max_experiences"])
 
             self.qsom_agents[agent_name] = qsom_agent
 
     def forward(self, obs_per_agent):
         """Choose an action for each agent, based on their observations."""
-        self._assert_known_agents(obs_per_agent.keys())
+        if __debug__:
+            self._assert_known_agents(obs_per_agent.keys())
         actions = {
             agent_name: self.qsom_agents[agent_name].forward(obs_per_agent[agent_name])
             for agent_name in obs_per_agent.keys()
@@ -142,8 +167,9 @@ class QSOM(Model):
 
     def backward(self, new_obs_per_agent, reward_per_agent):
         """Make each agent learn, based on their rewards and observations."""
-        self._assert_known_agents(new_obs_per_agent.keys())
-        self._assert_known_agents(reward_per_agent.keys())
+        if __debug__:
+            self._assert_known_agents(new_obs_per_agent.keys())
+            self._assert_known_agents(reward_per_agent.keys())
         for agent_name, agent in self.qsom_agents.items():
             agent.backward(
                 new_obs_per_agent[agent_name],
@@ -164,9 +190,13 @@ class QSOM(Model):
         .. note:: We silently ignore agents that are known but not any more in
             the env, to support (potential) future use-cases, such as agent
             termination.
+
+        .. note:: This check is performed at each step, and is thus skipped
+            when Python runs with optimizations (``python -O``), similarly
+            to ``assert`` statements.
         """
-        required_agents = set(required_agents_names)
-        known_agents = set(self.qsom_agents.keys())
-        missing_agents = required_agents - known_agents
+        # Dict keys views are set-like: the difference does not need to copy
+        # the known agents into a new set at each call.
+        missing_agents = required_agents_names - self.qsom_agents.keys()
         assert len(missing_agents) == 0, \
             f"Env contains agents that the QSOM model does not know: {missing_agents}"
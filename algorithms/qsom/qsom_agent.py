@@ -7,6 +7,8 @@ The Q-SOM Agent uses 2 SOMs to represent the continuous and multidimensional
 States and Actions.
 """
 
+from collections import deque
+
 import numpy as np
 from gymnasium.spaces import Box
 
@@ -28,10 +30,16 @@ class QsomAgent(object):
                  q_learning_rate=0.7,
                  q_discount_factor=0.9,
                  update_all=True,
-                 use_neighborhood=True
+                 use_neighborhood=True,
+                 max_experiences=10_000
                  ):
         """
         Initialize an Agent using the Q-SOM learning and decision algorithm.
+
+        :param max_experiences: The maximum number of experiences kept in
+            :py:attr:`.experiences`; older experiences are discarded. Use
+            ``None`` to keep all of them. Note that ``experiences`` is a
+            :py:class:`collections.deque`, which does not support slicing.
         """
 
         # The State Map (observations -> discrete state)
@@ -42,6 +50,16 @@ class QsomAgent(object):
         self.action_space = action_space
         self.action_som = action_som
 
+        # Bounds used to interpolate observations and actions from/to the
+        # [0,1]^n space of SOMs. Spaces do not change, so they are computed
+        # once, as arrays of `(low, high)` pairs.
+        assert len(self.observation_space.shape) == 1, 'Observation space must be 1D'
+        assert len(self.action_space.shape) == 1, 'Action space must be 1D'
+        self._observation_bounds = self._space_bounds(observation_space)
+        self._action_bounds = self._space_bounds(action_space)
+        self._unit_observation_bounds = self._unit_bounds(observation_space)
+        self._unit_action_bounds = self._unit_bounds(action_space)
+
         # Q-Table: Expected interest (i.e. Q-Value) of an action in a state
         self.qtable = np.zeros((self.state_som.nb_units,
                                 self.action_som.nb_units),
@@ -49,7 +67,10 @@ class QsomAgent(object):
         # Memorize the number of "hits" on each cell of the Q-Table
         self.hits = np.zeros(self.qtable.shape, dtype=int)
 
-        self.experiences = []
+        # Log of the most recent experiences. Older experiences are discarded
+        # so that memory does not grow with the number of steps; set
+        # `max_experiences` to `None` to keep all of them.
+        self.experiences = deque(maxlen=max_experiences)
 
         self.action_selector = action_selector
         self.action_perturbator = action_perturbator
@@ -130,33 +151,30 @@ class QsomAgent(object):
         self.step += 1
 
     def _update_qvalues(self, reward: float, max_reward: float):
-        # Compute the neighborhood of Input- and Action-SOM
-        # (i.e. the φS and φA in the update formula)
-        if self.use_neighborhood:
-            input_neigh = self.state_som.neighborhood(self.last_input_idx)
-            action_neigh = self.action_som.neighborhood(self.last_action_idx)
-        # Determine which Q-Values to update
+        # Δ = α*(r + γ*max_i Q[sj',ai] - Q[sm,an])
+        target = reward + self.gamma * max_reward
         if self.update_all:
-            # All Q-Values
-            states = range(self.state_som.nb_units)
-            actions = range(self.action_som.nb_units)
+            # All Q-Values, updated at once
+            delta = self.alpha * (target - self.qtable)
+            if self.use_neighborhood:
+                # Compute the neighborhood of Input- and Action-SOM
+                # (i.e. the φS and φA in the update formula).
+                # Units are indexed in row-major order (see `SOM.coords_map`),
+                # so the flattened neighborhoods are indexed by units' ids.
+                input_neigh = self.state_som.neighborhood(self.last_input_idx)
+                action_neigh = self.action_som.neighborhood(self.last_action_idx)
+                # Δ = α*φS(j,s,NS)*φA(k,a,NA)*(r + γ*max_i Q[sj',ai] - Q[sm,an])
+                delta *= np.outer(input_neigh.ravel(), action_neigh.ravel())
+            self.qtable += delta
         else:
             # Only the (state,action) pair that was used this step
-            states = [self.last_input_idx]
-            actions = [self.last_action_idx]
-        # Update the Q-Values
-        for s in states:
+            s, a = self.last_input_idx, self.last_action_idx
+            delta = self.alpha * (target - self.qtable[s][a])
             if self.use_neighborhood:
-                psi_s = input_neigh[self.state_som.coords_map[s]]  # <=> φS(j,s,NS)
-            for a in actions:
-                if self.use_neighborhood:
-                    psi_a = action_neigh[self.action_som.coords_map[a]]  # <=> φA(k,a,NA)
-                # Δ = α*(r + γ*max_i Q[sj',ai] - Q[sm,an])
-                delta = self.alpha * (reward + self.gamma * max_reward - self.qtable[s][a])
-                if self.use_neighborhood:
-                    # Δ = α*φS(j,s,NS)*φA(k,a,NA)*(r + γ*max_i Q[sj',ai] - Q[sm,an])
-                    delta *= (psi_s * psi_a)
-                self.qtable[s][a] += delta
+                psi_s = self.state_som.neighborhood(s)[self.state_som.coords_map[s]]
+                psi_a = self.action_som.neighborhood(a)[self.action_som.coords_map[a]]
+                delta *= (psi_s * psi_a)
+            self.qtable[s][a] += delta
 
     def _interpolate_observations(self, observations: np.ndarray):
         """
@@ -169,10 +187,9 @@ class QsomAgent(object):
         The original observation space is known to this agent as the
         `self.observation_space` attribute.
         """
-        assert len(self.observation_space.shape) == 1, 'Observation space must be 1D'
-        old_bounds = list(zip(self.observation_space.low, self.observation_space.high))
-        new_bounds = [(0.0, 1.0)] * self.observation_space.shape[0]
-        return interpolate(observations, old_bounds, new_bounds)
+        return interpolate(observations,
+                           self._observation_bounds,
+                           self._unit_observation_bounds)
 
     def _interpolate_action(self, action: np.ndarray):
         """
@@ -182,7 +199,16 @@ class QsomAgent(object):
         actions constrained to the [0,1]^n space. However, since actions
         are produced by SOMs, we interpolate in the other direction.
         """
-        assert len(self.action_space.shape) == 1, 'Action space must be 1D'
-        old_bounds = [(0.0, 1.0)] * self.action_space.shape[0]
-        new_bounds = list(zip(self.action_space.low, self.action_space.high))
-        return interpolate(action, old_bounds, new_bounds)
+        return interpolate(action,
+                           self._unit_action_bounds,
+                           self._action_bounds)
+
+    @staticmethod
+    def _space_bounds(space: Box) -> np.ndarray:
+        """Return the `(low, high)` bounds of each dimension of a 1D space."""
+        return np.stack([space.low, space.high], axis=1).astype(np.float64)
+
+    @staticmethod
+    def _unit_bounds(space: Box) -> np.ndarray:
+        """Return `(0, 1)` bounds for each dimension of a 1D space."""
+        return np.tile(np.array([0.0, 1.0]), (space.shape[0], 1))
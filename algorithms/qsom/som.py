@@ -24,7 +24,8 @@ class SOM(object):
                  unit_len,
                  sigma=1.0,
                  learning_rate=0.5,
-                 init='random'):
+                 init='random',
+                 dtype=np.float64):
         """
         Create a new Self-Organizing Map, with a rectangular shape.
 
@@ -36,6 +37,10 @@ class SOM(object):
         :param init: Method to initialize the neurons' units (vectors).
             Either 'random' (uniform distribution in `[0,1)`), or `zero`
             (all values are set to 0s).
+        :param dtype: The NumPy dtype of the neurons' units. Input data are
+            cast to this dtype, so that computations are not performed on
+            mixed types. ``np.float32`` halves the memory used by the map,
+            at the cost of precision.
         """
 
         # Shape
@@ -60,15 +65,22 @@ class SOM(object):
 
         # Weights of the map (dimx * dimy vectors of unit_len values)
         if init == 'zero':
-            self.units = np.zeros((dimx, dimy, unit_len))
+            self.units = np.zeros((dimx, dimy, unit_len), dtype=dtype)
         elif init == 'random':
-            self.units = np.random.rand(dimx, dimy, unit_len)
+            self.units = np.random.rand(dimx, dimy, unit_len).astype(dtype, copy=False)
         else:
             raise Exception(f'Unrecognized `init` argument: {init}')
 
         # Iteration step, used to compute the decay
         self.step = 0
 
+        # Neighborhood matrices already computed for the current sigma,
+        # indexed by their center. There are only `nb_units` possible
+        # centers; the cache is cleared when sigma changes (if it decays),
+        # so that it never holds more than `nb_units` matrices.
+        self._neighborhoods = {}
+        self._neighborhoods_sigma = None
+
         # Keep track of the quantization error
         self.error = []
         # Keep track of how many steps each unit is the Best Matching Unit (BMU)
@@ -109,12 +121,14 @@ class SOM(object):
         #   - k is the index of the winner node (center of neighborhood)
         #   - N is the size of the neighborhood
         # - u_k' is the data to learn
+        data = np.asarray(data, dtype=self.units.dtype)
         lr = self.learning_rate
         neighborhood = self.neighborhood(winner) * lr  # <=> λ*φ(k,...)
         unit_winner = self.get_unit(winner)
-        for x, y in np.ndindex(self.shape):
-            psi = neighborhood[x, y]  # <=> λ*φ(k,m,N)  with m=[x,y], k=winner
-            self.units[x, y] += (psi * (data - self.units[x, y]))
+        # Update all units at once: the neighborhood matrix is broadcast over
+        # the last axis (the units' vectors).
+        # <=> λ*φ(k,m,N)  with m=[x,y], k=winner
+        self.units += neighborhood[..., np.newaxis] * (data - self.units)
         self.error.append(fast_norm(data - unit_winner))
         self.step += 1
 
@@ -129,10 +143,19 @@ class SOM(object):
         :param center: The index of the center neuron in this neighborhood.
         :return: A matrix in which an element, indexed by (i,j), is the
             distance of the neuron with coordinates (i,j) to the center neuron
-            (weighted by the size of the neighborhood).
+            (weighted by the size of the neighborhood). This matrix is cached
+            and thus read-only.
         """
-        center = self.coords_map[center]
-        return self._gaussian(center, self.sigma)
+        sigma = self.sigma
+        if sigma != self._neighborhoods_sigma:
+            self._neighborhoods.clear()
+            self._neighborhoods_sigma = sigma
+        neighborhood = self._neighborhoods.get(center)
+        if neighborhood is None:
+            neighborhood = self._gaussian(self.coords_map[center], sigma)
+            neighborhood.setflags(write=False)
+            self._neighborhoods[center] = neighborhood
+        return neighborhood
 
     def _compute_activation_map(self, data):
         """
@@ -140,15 +163,10 @@ class SOM(object):
         neuron with coordinates (i,j) to the vector data.
         The lower the activation, the closest the neuron is to data.
         """
-        data = np.asarray(data)
+        data = np.asarray(data, dtype=self.units.dtype)
         sub = np.subtract(data, self.units)  # x - w
-        # https://docs.scipy.org/doc/numpy/reference/arrays.nditer.html
-        activation_map = np.zeros(self.shape)
-        it = np.nditer(activation_map, flags=['multi_index'])
-        while not it.finished:
-            # || x - w ||
-            activation_map[it.multi_index] = fast_norm(sub[it.multi_index])
-            it.iternext()
+        # || x - w || for all neurons at once (sum over the last axis)
+        activation_map = np.sqrt(np.einsum('ijk,ijk->ij', sub, sub))
         return activation_map
 
     def _decay(self, value, step):
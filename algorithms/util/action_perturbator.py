@@ -76,14 +76,15 @@ class MultiDimActionPerturbator(ActionPerturbator):
         self.proba = probability
 
     def perturb(self, action, clip=True):
-        # Draw a die for each dimension to apply (or not) a random noise
-        for k in range(len(action)):
-            if np.random.random() < self.proba:
-                # Apply noise to this dimension
-                noise = np.random.uniform(-self.noise, self.noise)
-                action[k] = action[k] + noise
-                if clip:
-                    action[k] = np.clip(action[k], 0.0, 1.0)
+        # Draw a die for each dimension to apply (or not) a random noise.
+        # Dice and noises are drawn for all dimensions at once.
+        size = len(action)
+        perturbed = np.random.random(size) < self.proba
+        noise = np.random.uniform(-self.noise, self.noise, size)
+        # Apply noise to the selected dimensions only
+        action[perturbed] += noise[perturbed]
+        if clip:
+            action[perturbed] = np.clip(action[perturbed], 0.0, 1.0)
         return action
 
 
@@ -64,7 +64,7 @@ class BoltzmannActionSelector(ActionSelector):
             tau = max(tau, 0.01)
         else:
             tau = self.initial_tau
-        # Then, compute the weight for each value (exp(Q[s,a]) / τ)
+        # Then, compute the weight for each value (exp(Q[s,a]) / τ), all at once
         indices = np.arange(len(values))
-        weights = [np.exp(values[i] / tau) for i in indices]
+        weights = np.exp(np.asarray(values) / tau)
         return choices(indices, weights=weights, k=1)[0]
@@ -5,10 +5,9 @@ This module contains the Agent class, its state (AgentState) and Action.
 import math
 from collections import namedtuple
 
-import numpy as np
-
 from .profile import AgentProfile
 from smartgrid.util.bounded import (increase_bounded, decrease_bounded)
+from smartgrid.util.interpolate import interpolate
 
 
 class AgentState(object):
@@ -56,19 +55,20 @@ class AgentState(object):
     """
 
     def __init__(self):
-        self.comfort = 0
-        self.payoff = 0
-        self.storage = 0
-        self.need = 0
-        self.production = 0
-        self.previous_storage = 0
+        self.reset()
 
     def __repr__(self):
         return '<AgentState comfort={} payoff={} storage={} need={} production={} previous_storage={}' \
             .format(self.comfort, self.payoff, self.storage, self.need, self.production, self.previous_storage)
 
     def reset(self):
-        self.__init__()
+        """Reset all values to 0, in place."""
+        self.comfort = 0.0
+        self.payoff = 0.0
+        self.storage = 0.0
+        self.need = 0.0
+        self.production = 0.0
+        self.previous_storage = 0.0
 
 
 Action = namedtuple('Action', [
@@ -87,6 +87,10 @@ Action.__doc__ = """
     considering the physical constraints of the world).
 """
 
+# Action that does nothing (0 for all parameters). Actions are immutable, so
+# this instance can be shared by all agents.
+_ZERO_ACTION = Action(*[0.0] * len(Action._fields))
+
 
 class Agent(object):
     """
@@ -109,6 +113,10 @@ class Agent(object):
     # The range in which the 'payoff' can be.
     payoff_range = (-10_000, +10_000)
 
+    # The quantity of energy that 1 unit of payoff buys (or is earned by
+    # selling this quantity of energy).
+    energy_per_payoff = 10
+
     def __init__(self,
                  name: str,
                  profile: AgentProfile,
@@ -174,9 +182,9 @@ class Agent(object):
         # Reset all state values to 0
         self.state.reset()
 
-        # Create a fake action (0 for all parameters)
-        self.intended_action = Action(*[0.0] * len(Action._fields))
-        self.enacted_action = self.intended_action
+        # Use a fake action (0 for all parameters)
+        self.intended_action = _ZERO_ACTION
+        self.enacted_action = _ZERO_ACTION
 
         # Update state for the 1st step (need, production, storage, ...)
         # Note that comfort will most likely remain at 0 since action does nothing
@@ -197,12 +205,16 @@ class Agent(object):
     @property
     def storage_ratio(self) -> float:
         """Return the current storage quantity over its capacity (in [0,1])."""
-        return self.state.storage / (self.profile.max_storage + 10E-300)
+        max_storage = self.profile.max_storage
+        if max_storage == 0:
+            # The storage cannot exceed its capacity, so it is empty as well.
+            return 0.0
+        return self.state.storage / max_storage
 
     @property
     def payoff_ratio(self) -> float:
         """Return the current payoff scaled to [0,1]."""
-        return np.interp(self.state.payoff, self.payoff_range, (0, 1))
+        return interpolate(self.state.payoff, self.payoff_range, (0, 1))
 
     def __str__(self):
         return '<Agent {}>'.format(self.name)
@@ -233,17 +245,25 @@ class Agent(object):
         # immediately consume 500Wh, give 150Wh, and store the remaining 350Wh.
         action = self.intended_action
         new_storage = self.state.storage
+        payoff = self.state.payoff
+        # The bounded updates below are inlined versions of `decrease_bounded`
+        # and `increase_bounded` (this method is called for every agent at
+        # every step); they yield exactly the same values.
+        assert action.buy_energy >= 0 and action.sell_energy >= 0 \
+            and action.storage_consumption >= 0 and action.give_energy >= 0
 
         # 1. Agent buys energy
         # (can be limited by the current payoff)
-        rate = 0.1
-        price = math.ceil(rate * action.buy_energy)
+        # Prices are computed by dividing (or multiplying) by the integer
+        # `energy_per_payoff`, rather than multiplying (or dividing) by its
+        # inverse, which cannot be exactly represented as a float.
+        price = math.ceil(action.buy_energy / self.energy_per_payoff)
         # limit price by current payoff
-        self.state.payoff, price, _ = decrease_bounded(self.state.payoff,
-                                                       price,
-                                                       self.payoff_range[0])
+        new_payoff = max(self.payoff_range[0], payoff - price)
+        price = payoff - new_payoff
+        payoff = new_payoff
         # actually bought quantity
-        bought = int(math.floor(price / rate))
+        bought = math.floor(price * self.energy_per_payoff)
         new_storage += bought
 
         # 2. Agent stores energy
@@ -254,26 +274,24 @@ class Agent(object):
         # (can be limited by the current storage, including bought and stored)
         # Note: agent could sell for more than it can really gain, because the
         # payoff is bounded. In this case, the money is "lost".
-        rate = 0.1
-        new_storage, sold, _ = decrease_bounded(new_storage,
-                                                action.sell_energy,
-                                                0)
-        price = math.floor(rate * sold)
-        self.state.payoff, _, _ = increase_bounded(self.state.payoff,
-                                                   price,
-                                                   self.payoff_range[1])
+        remaining = max(0, new_storage - action.sell_energy)
+        sold = new_storage - remaining
+        new_storage = remaining
+        price = math.floor(sold / self.energy_per_payoff)
+        payoff = min(payoff + price, self.payoff_range[1])
+        self.state.payoff = payoff
 
         # 4. Agent consumes from storage
         # (can be limited by the storage)
-        new_storage, storage_consumed, _ = decrease_bounded(new_storage,
-                                                            action.storage_consumption,
-                                                            0)
+        remaining = max(0, new_storage - action.storage_consumption)
+        storage_consumed = new_storage - remaining
+        new_storage = remaining
 
         # 5. Agent gives to the grid
         # (can be limited by the storage)
-        new_storage, given, _ = decrease_bounded(new_storage,
-                                                 action.give_energy,
-                                                 0)
+        remaining = max(0, new_storage - action.give_energy)
+        given = new_storage - remaining
+        new_storage = remaining
 
         # 6. Agent consumes from the grid
         # (we assume that agent can consume as much as wanted)
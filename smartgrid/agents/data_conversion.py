@@ -4,7 +4,7 @@ This module is used to convert raw data into Agent Profiles.
 
 import random
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Tuple
 
 import numpy as np
 
@@ -84,6 +84,11 @@ class DataOpenEIConversion(DataConversion):
     # in the parent class... *sigh*
     profiles: Dict[str, AgentProfile]
 
+    def __init__(self):
+        super().__init__()
+        # Arrays already read from data files, indexed by their path.
+        self._data = {}
+
     def load(self, name, data_path, comfort_fn=None) -> AgentProfile:
         """
         Load a profile from an OpenEI-based data file.
@@ -104,24 +109,15 @@ class DataOpenEIConversion(DataConversion):
         :return: The loaded AgentProfile for direct use.
         """
 
-        # Load the NPZ file
-        content = np.load(data_path)
-
-        # Check that the file's structure is correct
-        missing_keys = [k for k in self.expected_keys if k not in content.files]
-        if len(missing_keys) > 0:
-            raise Exception(f'Profile {name} in file {data_path} incorrectly '
-                            f'formatted! Missing elements: {missing_keys}')
+        needs, max_storage, action_limit = self._read_data(name, data_path)
 
         # Parse data from the file
 
         # - `max_storage`
         # .npz files only store arrays, we want `max_storage` a single value
-        max_storage = content['max_storage']
         max_storage = self._get_ndarray_single_value(max_storage)
 
         # - `needs`
-        needs = np.asarray(content['needs'])
         need_profile = NeedProfile(needs)
 
         # - `production`
@@ -131,13 +127,13 @@ class DataOpenEIConversion(DataConversion):
         production_upper_bound = int(0.1 * max_storage)
         productions = [
             random.randint(0, production_upper_bound)
-            for _ in range(len(needs))
+            for _ in range(needs.shape[0])
         ]
-        production_profile = ProductionProfile(np.asarray(productions))
+        production_profile = ProductionProfile(productions)
 
         # - `action_limit`
         low = np.int64(0)
-        high = self._get_ndarray_single_value(content['action_limit'])
+        high = self._get_ndarray_single_value(action_limit)
 
         if comfort_fn is None:
             raise Exception('The comfort function `comfort_fn` must be specified!')
@@ -157,6 +153,38 @@ class DataOpenEIConversion(DataConversion):
         self.profiles[name] = profile
         return profile
 
+    def _read_data(self, name: str, data_path: str) -> Tuple[np.ndarray, ...]:
+        """
+        Internal method to read the arrays of a data file.
+
+        Arrays are cached per data file, so that loading several profiles
+        from the same file only reads it once. The cached arrays are
+        read-only, as they may be shared by several profiles.
+
+        :return: The ``needs``, ``max_storage`` and ``action_limit`` arrays.
+        """
+        data = self._data.get(data_path)
+        if data is not None:
+            return data
+
+        # Load the NPZ file. Each array is read (and decompressed) from the
+        # archive when accessed, so we access each of them only once, and
+        # close the file as soon as we are done.
+        with np.load(data_path) as content:
+
+            # Check that the file's structure is correct
+            missing_keys = [k for k in self.expected_keys if k not in content.files]
+            if len(missing_keys) > 0:
+                raise Exception(f'Profile {name} in file {data_path} incorrectly '
+                                f'formatted! Missing elements: {missing_keys}')
+
+            data = (content['needs'], content['max_storage'], content['action_limit'])
+
+        for array in data:
+            array.setflags(write=False)
+        self._data[data_path] = data
+        return data
+
     def _get_ndarray_single_value(self, array: np.ndarray):
         """Internal method to get the single value of a 0d or 1d ndarray."""
         if len(array.shape) == 0:
@@ -72,7 +72,7 @@ w.r.t. the consumption and need, for each of the implemented functions.
     plt.show()
 """
 
-from decimal import Decimal
+import math
 
 
 def flexible_comfort_profile(consumption: float, need: float) -> float:
@@ -89,7 +89,7 @@ def flexible_comfort_profile(consumption: float, need: float) -> float:
         need. The comfort is guaranteed to be within [0,1].
     """
     ratio = consumption / (need + 10E-300)
-    return richard_curve(ratio, q=0.1, b=20, v=2, m=1 / 2)
+    return _flexible_curve(ratio)
 
 
 def neutral_comfort_profile(consumption: float, need: float) -> float:
@@ -107,7 +107,7 @@ def neutral_comfort_profile(consumption: float, need: float) -> float:
         need. The comfort is guaranteed to be within [0,1].
     """
     ratio = consumption / (need + 10E-300)
-    return richard_curve(ratio, q=1, b=10, v=1, m=1 / 2)
+    return _neutral_curve(ratio)
 
 
 def strict_comfort_profile(consumption: float, need: float) -> float:
@@ -124,7 +124,7 @@ def strict_comfort_profile(consumption: float, need: float) -> float:
         need. The comfort is guaranteed to be within [0,1].
     """
     ratio = consumption / (need + 10E-300)
-    return richard_curve(ratio, q=10, b=16, v=0.7, m=1 / 2)
+    return _strict_curve(ratio)
 
 
 def richard_curve(x, a=0.0, k=1.0, b=1.0, v=1.0, q=1.0, c=1.0, m=0.0) -> float:
@@ -146,8 +146,40 @@ def richard_curve(x, a=0.0, k=1.0, b=1.0, v=1.0, q=1.0, c=1.0, m=0.0) -> float:
     :param m: Starting point
     :return: The value of the curve at x.
     """
-    a, k, b, v, q, c = (Decimal(a), Decimal(k), Decimal(b), Decimal(v), Decimal(q), Decimal(c))
-    # x can be a numpy float, which is not directly convertible into Decimal
-    x = Decimal(float(x))
-    m = Decimal(float(m))
-    return float(a + (k - a) / ((c + q * (-b * (x - m)).exp()) ** (1 / v)))
+    # x can be a numpy float; we use Python floats so that overflows raise
+    # an error instead of silently returning `inf` with a warning.
+    x = float(x)
+    try:
+        return float(a + (k - a) / ((c + q * math.exp(-b * (x - m))) ** (1 / v)))
+    except OverflowError:
+        # The denominator is too large to be represented: the curve is at
+        # its lower asymptote.
+        return float(a)
+
+
+def _make_richard_curve(a=0.0, k=1.0, b=1.0, v=1.0, q=1.0, c=1.0, m=0.0):
+    """
+    Return a Richard's Curve specialized for the given parameters.
+
+    The returned function only takes ``x`` and is equivalent to
+    ``richard_curve(x, a, k, b, v, q, c, m)``, but the constant terms are
+    computed once, rather than at each call.
+    """
+    a = float(a)
+    k_minus_a = k - a
+    inv_v = 1 / v
+
+    def curve(x) -> float:
+        x = float(x)
+        try:
+            return float(a + k_minus_a / ((c + q * math.exp(-b * (x - m))) ** inv_v))
+        except OverflowError:
+            return a
+
+    return curve
+
+
+# Curves used by the comfort functions, specialized once at import.
+_flexible_curve = _make_richard_curve(q=0.1, b=20, v=2, m=1 / 2)
+_neutral_curve = _make_richard_curve(q=1, b=10, v=1, m=1 / 2)
+_strict_curve = _make_richard_curve(q=10, b=16, v=0.7, m=1 / 2)
@@ -2,7 +2,7 @@
 Determine the energy needed by an Agent for each step of the simulation.
 """
 
-from typing import List
+import numpy as np
 
 
 class NeedProfile:
@@ -30,7 +30,7 @@ class NeedProfile:
     class, and is part of the :py:class:`.AgentProfile`.
     """
 
-    need_per_hour: List[float]
+    need_per_hour: np.ndarray
     """
     Array of needs (one for each time step).
     
@@ -67,10 +67,11 @@ class NeedProfile:
 
         :param need_per_hour: The list (array) of needs, i.e., floats, for
             each hour, such that the 1st element represents the 1st hour, and
-            so on.
+            so on. It is stored as a NumPy array (without copy if it is
+            already one).
         """
-        self.need_per_hour = need_per_hour
-        self.max_energy_needed = max(need_per_hour)
+        self.need_per_hour = np.asarray(need_per_hour)
+        self.max_energy_needed = self.need_per_hour.max()
 
     def compute(self, step=0) -> float:
         """
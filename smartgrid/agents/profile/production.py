@@ -2,7 +2,7 @@
 Determines the energy produced by an Agent for each step of the simulation.
 """
 
-from typing import List
+import numpy as np
 
 
 class ProductionProfile:
@@ -38,7 +38,7 @@ class ProductionProfile:
     :py:class:`.AgentProfile`.
     """
 
-    production_per_hour: List[float]
+    production_per_hour: np.ndarray
     """
     Array of productions (one for each time step).
     
@@ -66,9 +66,10 @@ class ProductionProfile:
 
         :param production_per_hour: The list (array) of production, i.e., floats,
             for each hour, such that the 1st element represents the 1st hour,
-            and so on.
+            and so on. It is stored as a NumPy array (without copy if it is
+            already one).
         """
-        self.production_per_hour = production_per_hour
+        self.production_per_hour = np.asarray(production_per_hour)
 
     def compute(self, step=0) -> float:
         """
@@ -189,35 +189,43 @@ class SmartGrid(pettingzoo.ParallelEnv):
             can be obtained with
             ``all(terminated_n.values()) or all(truncated_n.values())``.
         """
-        if self.max_step is not None and self.world.current_step >= self.max_step:
+        # Local bindings, to avoid resolving the same attributes repeatedly.
+        world = self.world
+        agents_by_name = world.agents_by_name
+
+        if self.max_step is not None and world.current_step >= self.max_step:
             warnings.warn(f'max_step was set to {self.max_step}, but step'
-                          f'{self.world.current_step} was requested.')
+                          f'{world.current_step} was requested.')
 
         # Set action for each agent (will be performed in `world.step()`)
         for agent_name, action in actions.items():
-            agent = self.world.agents_by_name.get(agent_name)
+            agent = agents_by_name.get(agent_name)
             assert agent is not None, f'Agent {agent_name} not found'
-            agent.intended_action = Action(*action)
+            # `_make` builds the Action directly from the iterable (e.g., an
+            # ndarray), without unpacking it into arguments first.
+            agent.intended_action = Action._make(action)
 
         # Next step of simulation
-        self.world.step()
+        world.step()
 
         # Get next observations and rewards
         obs = self._get_obs()
         reward_n = self._get_reward()
 
         # Agents are never "terminated" (they cannot die or stop acting)
-        terminated_n = {agent.name: False for agent in self.world.agents}
+        # Note: `agents_by_name` is indexed by the agents' names, so we can
+        # build these dicts from its keys, without iterating over agents.
+        terminated_n = dict.fromkeys(agents_by_name, False)
 
         # Agents are truncated only if the `max_step` is defined, and higher
         # than the current time step. They are either all truncated, or none
         # of them is.
         if self.max_step is None:
-            truncated_n = {agent.name: False for agent in self.world.agents}
+            truncated = False
         else:
             # We use `-1` because the first step is the `0th`.
-            truncated = self.world.current_step >= self.max_step - 1
-            truncated_n = {agent.name: truncated for agent in self.world.agents}
+            truncated = world.current_step >= self.max_step - 1
+        truncated_n = dict.fromkeys(agents_by_name, truncated)
 
         # Only used for visualization, performance metrics, ...
         info_n = self._get_info(reward_n)
@@ -291,8 +299,11 @@ class SmartGrid(pettingzoo.ParallelEnv):
             and :py:meth:`~smartgrid.observation.base_observation.Observation.get_local_observation`
             methods.
         """
+        # The global observation is the same for all agents: compute it once.
+        global_obs = self.observation_manager.compute_global(self.world)
         return {
-            agent.name: self.observation_manager.compute(self.world, agent)
+            agent.name: self.observation_manager.compute(self.world, agent,
+                                                         global_obs)
             for agent in self.world.agents
         }
 
@@ -335,11 +346,13 @@ class SmartGrid(pettingzoo.ParallelEnv):
             name. Each element is itself a dictionary that currently contains
             only the agent's reward, indexed by ``'reward'``.
         """
+        # `rewards` is already indexed by all agents' names; iterating over its
+        # items avoids a lookup per agent.
         return {
             agent_name: {
-                'reward': rewards[agent_name]
+                'reward': agent_rewards
             }
-            for agent_name in self.agents
+            for agent_name, agent_rewards in rewards.items()
         }
 
     @property
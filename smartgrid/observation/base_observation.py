@@ -78,18 +78,18 @@ class BaseObservation:
         :return: The observation represented as a dictionary, with the fields'
             names as keys and the fields' values as values, in the order of
             definition.
+
+        .. note::
+            Contrary to :py:func:`dataclasses.asdict`, values are not
+            (deep-)copied: the dictionary contains the fields' values
+            themselves. Observations' values are typically floats, which
+            makes no difference, and this method is called for each agent
+            at each time step, so avoiding the recursive copy (which would
+            also traverse excluded fields) is significantly faster.
         """
-        # Although `asdict` has a `dict_factory` parameter that we could use,
-        # it would not be a good idea, because it would be used recursively
-        # for anything contained inside this dataclass. Instead, we get the
-        # "whole" dictionary.
-        d = dataclasses.asdict(self)
-        # Now, we must remove the (potential) elements that should be excluded.
-        included_fields = self.fields()
         return {
-            key: d[key]
-            for key in included_fields
-            if key in d
+            field: getattr(self, field)
+            for field in self.fields()
         }
 
     @classmethod
@@ -136,7 +136,7 @@ class BaseObservation:
             dtype=np.float64
         )
 
-    def __array__(self) -> np.ndarray:
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
         """
         Magic method that simplifies the translation into NumPy arrays.
 
@@ -150,10 +150,25 @@ class BaseObservation:
 
         The resulting array's values are guaranteed to be in the same order
         as the Observation's fields, see :py:meth:`~.fields`.
+
+        :param dtype: The desired dtype of the array, as requested by
+            e.g., ``np.asarray(obs, dtype=np.float32)``.
+        :param copy: As in the NumPy 2 ``__array__`` protocol. The array must
+            always be created from the fields' values, so ``copy=False``
+            ("never copy") cannot be honoured and raises a ``ValueError``;
+            ``None`` and ``True`` both create a new array.
+
+        :raises ValueError: If ``copy`` is ``False``.
         """
-        # Using `[*values()]` seems more efficient than other methods
-        # e.g., `list(values())` or `values()` directly.
-        return np.array([*self.asdict().values()])
+        if copy is False:
+            raise ValueError(
+                f'{type(self).__qualname__} cannot be converted to an array '
+                'without copying its values (copy=False).'
+            )
+        # We read the fields directly, there is no need to build an
+        # intermediate dict through `asdict`.
+        return np.array([getattr(self, field) for field in self.fields()],
+                        dtype=dtype)
 
 
 class Observation(BaseObservation, abc.ABC):
@@ -8,7 +8,25 @@ from typing import ClassVar, Optional
 import numpy as np
 
 from smartgrid.observation.base_observation import BaseObservation
-from smartgrid.util import hoover
+from smartgrid.util import hoover, interpolate
+
+
+def _median(values: np.ndarray) -> float:
+    """
+    Return the median of a 1D array, or NaN if it is empty.
+
+    This yields the same result as :py:func:`numpy.median`, but only
+    partitions the array around its middle element(s), and avoids the
+    generic (axis-aware) machinery, which dominates on small arrays.
+    """
+    n = values.size
+    if n == 0:
+        return np.nan
+    half = n // 2
+    if n % 2 == 1:
+        return np.partition(values, half)[half]
+    partitioned = np.partition(values, (half - 1, half))
+    return (partitioned[half - 1] + partitioned[half]) / 2
 
 
 @dataclasses.dataclass(frozen=True)
@@ -163,15 +181,16 @@ class GlobalObservation(BaseObservation):
         sum_taken, sum_given, sum_transactions, sum_consumed, sum_stored = 0, 0, 0, 0, 0
         for a in world.agents:
             comforts.append(a.state.comfort)
-            sum_taken += a.enacted_action.grid_consumption + a.enacted_action.store_energy
-            sum_given += a.enacted_action.give_energy
-            sum_transactions += a.enacted_action.buy_energy + a.enacted_action.sell_energy
-            sum_consumed += a.enacted_action.grid_consumption + a.enacted_action.storage_consumption
-            sum_stored += a.enacted_action.store_energy
+            action = a.enacted_action
+            sum_taken += action.grid_consumption + action.store_energy
+            sum_given += action.give_energy
+            sum_transactions += action.buy_energy + action.sell_energy
+            sum_consumed += action.grid_consumption + action.storage_consumption
+            sum_stored += action.store_energy
 
         # Compute some common measures about env
         hour = (world.current_step % 24) / 24
-        available_energy = np.interp(
+        available_energy = interpolate(
             world.available_energy,
             world.energy_generator.available_energy_bounds(
                 world.current_need,
@@ -181,6 +200,9 @@ class GlobalObservation(BaseObservation):
             ),
             (0, 1)
         )
+        # The comforts are used in several NumPy computations below; converting
+        # them once avoids an implicit conversion in each of these calls.
+        comforts = np.asarray(comforts)
         equity = 1.0 - hoover(comforts)
 
         over_consumption = max(0.0, sum_taken - sum_given - world.available_energy)
@@ -191,12 +213,12 @@ class GlobalObservation(BaseObservation):
         autonomy = 1.0 - sum_transactions / (sum_consumed + sum_stored
                                              + sum_given + sum_transactions + 10E-300)
 
-        well_being = np.median(comforts)
+        well_being = _median(comforts)
         if np.isnan(well_being):
             well_being = 0.0
 
         threshold = well_being / 2
-        exclusion = len([c for c in comforts if c < threshold]) / len(comforts)
+        exclusion = np.count_nonzero(comforts < threshold) / comforts.size
 
         cls.last_step_compute = world.current_step
         cls.computed = cls(
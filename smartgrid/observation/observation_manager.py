@@ -2,7 +2,7 @@
 The ObservationManager is responsible for computing observations.
 """
 import dataclasses
-from typing import Dict, Type
+from typing import Dict, Optional, Type
 
 from smartgrid.agents import Agent
 from smartgrid.world import World
@@ -136,8 +136,22 @@ class ObservationManager:
         """
         return self.global_observation.compute(world)
 
-    def compute(self, world: World, agent: Agent) -> Observation:
-        global_obs = self.compute_global(world)
+    def compute(self,
+                world: World,
+                agent: Agent,
+                global_obs: Optional[GlobalObservation] = None) -> Observation:
+        """
+        Create the (merged) observation for an Agent.
+
+        :param world: The World in which the Agent is.
+        :param agent: The Agent for which we want to compute observations.
+        :param global_obs: The global observation of the World at the current
+            time step, if it is already known (e.g., when computing the
+            observations of all agents). If ``None``, it is computed through
+            :py:meth:`.compute_global`.
+        """
+        if global_obs is None:
+            global_obs = self.compute_global(world)
         local_obs = self.compute_agent(world, agent)
         return self.observation.create(global_obs, local_obs)
 
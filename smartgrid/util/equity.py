@@ -14,16 +14,14 @@ def hoover(values):
     """
     Statistical measure of inequality.
 
-    :param values: A list of integers, representing the distribution (incomes,
-        comforts, ...).
+    :param values: A list (or NumPy array) of numbers, representing the
+        distribution (incomes, comforts, ...).
     :return: A float between 0 (perfect equality) and 1 (perfect inequality).
     """
-    if len(values) == 0:
+    values = np.asarray(values, dtype=np.float64)
+    if values.size == 0:
         return 0.0
-    mean = np.mean(values)
-    sum_xi = 0
-    sum_diff = 0
-    for x in values:
-        sum_xi += x
-        sum_diff += abs(x - mean)
+    sum_xi = values.sum()
+    mean = sum_xi / values.size
+    sum_diff = np.abs(values - mean).sum()
     return sum_diff / (2 * sum_xi + 10E-300)
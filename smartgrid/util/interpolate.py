@@ -39,17 +39,55 @@ def interpolate(value, old_bounds, new_bounds):
         is an array, a numpy ndarray is returned, in which each element was
         interpolated from its corresponding old domain to its new one.
     """
+    if isinstance(value, (float, int, np.number)):
+        # Fast path for single values, avoids raising an exception in `len`.
+        return _interpolate_scalar(value, old_bounds, new_bounds)
     try:
         size = len(value)
     except TypeError:
         # `value` has no length => it is a single value
-        interpolated = np.interp(value, old_bounds, new_bounds)
-        return interpolated
+        return _interpolate_scalar(value, old_bounds, new_bounds)
     # `value` has a length => array of multiple values
     assert size == len(old_bounds) == len(new_bounds)
-    interpolated = [
-        np.interp(value[k], old_bounds[k], new_bounds[k])
-        for k in range(len(value))
-    ]
-    interpolated = np.array(interpolated)
+    # Interpolate all dimensions at once, rather than calling `np.interp`
+    # for each of them. The comparisons and formula are the same as in
+    # `_interpolate_scalar` (and `np.interp`), so that results are identical.
+    value = np.asarray(value, dtype=np.float64)
+    old_bounds = np.asarray(old_bounds, dtype=np.float64)
+    new_bounds = np.asarray(new_bounds, dtype=np.float64)
+    old_low, old_high = old_bounds[:, 0], old_bounds[:, 1]
+    new_low, new_high = new_bounds[:, 0], new_bounds[:, 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = (new_high - new_low) / (old_high - old_low)
+        interpolated = slope * (value - old_low) + new_low
+    # Values outside of (or at the bounds of) the domain take the new bounds;
+    # `value >= old_high` also covers degenerate domains (`old_low == old_high`).
+    interpolated = np.where(value <= old_low, new_low, interpolated)
+    interpolated = np.where(value >= old_high, new_high, interpolated)
     return interpolated
+
+
+def _interpolate_scalar(value, old_bounds, new_bounds) -> float:
+    """
+    Interpolate a single value, exactly as ``np.interp`` would.
+
+    ``np.interp`` has a large overhead on single values (conversion of the
+    arguments to arrays, and of the result from an array). This function
+    performs the same comparisons and computations in plain Python, so that
+    its results are identical to ``np.interp``'s.
+    """
+    # `np.interp` computes on doubles, we thus convert everything to floats.
+    value = float(value)
+    old_low, old_high = float(old_bounds[0]), float(old_bounds[1])
+    new_low, new_high = float(new_bounds[0]), float(new_bounds[1])
+    if value > old_high:
+        return new_high
+    if value < old_low:
+        return new_low
+    # `value == old_high` also covers degenerate domains (`old_low == old_high`)
+    if value == old_high:
+        return new_high
+    if value == old_low:
+        return new_low
+    slope = (new_high - new_low) / (old_high - old_low)
+    return slope * (value - old_low) + new_low
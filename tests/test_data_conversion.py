@@ -0,0 +1,43 @@
+import unittest
+
+import numpy as np
+
+from smartgrid.agents import DataOpenEIConversion
+from smartgrid.agents.profile import comfort
+from smartgrid.make_env import find_profile_data
+
+
+class TestDataConversion(unittest.TestCase):
+
+    def test_openei_load(self):
+        """Profiles are correctly loaded from the data file's content."""
+        data_path = find_profile_data('openei', 'profile_office_daily.npz')
+        converter = DataOpenEIConversion()
+        profile = converter.load('Office', data_path,
+                                 comfort.neutral_comfort_profile)
+
+        with np.load(data_path) as content:
+            self.assertEqual(profile.max_storage, content['max_storage'][0])
+            self.assertTrue(np.all(profile.action_space.high
+                                   == content['action_limit'][0]))
+            np.testing.assert_array_equal(profile.need_fn.need_per_hour,
+                                          content['needs'])
+        self.assertIs(converter.profiles['Office'], profile)
+
+    def test_openei_load_same_file(self):
+        """Loading several profiles from the same file reuses its data."""
+        data_path = find_profile_data('openei', 'profile_office_daily.npz')
+        converter = DataOpenEIConversion()
+        profile1 = converter.load('Office1', data_path,
+                                  comfort.neutral_comfort_profile)
+        profile2 = converter.load('Office2', data_path,
+                                  comfort.strict_comfort_profile)
+
+        self.assertIsNot(profile1, profile2)
+        self.assertIs(profile1.need_fn.need_per_hour,
+                      profile2.need_fn.need_per_hour)
+        self.assertEqual(profile1.max_storage, profile2.max_storage)
+
+
+if __name__ == '__main__':
+    unittest.main()
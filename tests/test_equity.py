@@ -0,0 +1,39 @@
+import unittest
+
+import numpy as np
+
+from smartgrid.util.equity import hoover
+
+
+class TestEquity(unittest.TestCase):
+
+    def test_hoover(self):
+        # Perfect equality => 0
+        self.assertAlmostEqual(hoover([0.5, 0.5, 0.5]), 0.0)
+
+        # One agent has everything => (n-1)/n
+        self.assertAlmostEqual(hoover([0, 0, 0, 1]), 0.75)
+
+        # mean = 2, sum(|x - mean|) = 2, sum(x) = 6 => 2 / 12
+        self.assertAlmostEqual(hoover([1, 2, 3]), 1 / 6)
+
+    def test_hoover_reference(self):
+        """Compare with a straightforward computation of the Hoover index."""
+        for size in (1, 2, 7, 26, 100):
+            values = np.random.rand(size).tolist()
+            mean = sum(values) / len(values)
+            sum_diff = sum(abs(x - mean) for x in values)
+            expected = sum_diff / (2 * sum(values))
+            self.assertAlmostEqual(hoover(values), expected)
+            self.assertAlmostEqual(hoover(np.asarray(values)), expected)
+
+    def test_hoover_empty(self):
+        self.assertEqual(hoover([]), 0.0)
+        self.assertEqual(hoover(np.asarray([])), 0.0)
+
+        # All zeros: no division by zero
+        self.assertEqual(hoover([0, 0]), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
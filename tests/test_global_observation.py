@@ -0,0 +1,37 @@
+import unittest
+
+import numpy as np
+
+from smartgrid.observation.global_observation import GlobalObservation, _median
+
+
+class TestGlobalObservation(unittest.TestCase):
+
+    def test_median(self):
+        """`_median` gives the same result as `np.median`."""
+        for size in (1, 2, 3, 4, 25, 26):
+            with self.subTest(size=size):
+                values = np.random.rand(size)
+                self.assertEqual(_median(values), np.median(values))
+
+        # Even size: the mean of the two middle elements.
+        self.assertEqual(_median(np.asarray([4.0, 1.0, 3.0, 2.0])), 2.5)
+        # Odd size: the middle element.
+        self.assertEqual(_median(np.asarray([5.0, 1.0, 3.0])), 3.0)
+
+    def test_median_empty(self):
+        self.assertTrue(np.isnan(_median(np.asarray([]))))
+
+    def test_array(self):
+        """Observations are converted to arrays, in the fields' order."""
+        values = [0.1 * i for i in range(len(GlobalObservation.fields()))]
+        obs = GlobalObservation(*values)
+        np.testing.assert_array_equal(np.asarray(obs), values)
+        self.assertEqual(np.asarray(obs, dtype=np.float32).dtype, np.float32)
+        # The values must be copied into a new array.
+        with self.assertRaises(ValueError):
+            obs.__array__(copy=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
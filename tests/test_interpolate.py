@@ -29,6 +29,28 @@ class TestInterpolate(unittest.TestCase):
         self.assertLessEqual(interpolated, new_bounds[1])
         self.assertAlmostEqual(interpolated, -60)
 
+    def test_interpolate_scalar_interp(self):
+        """Single values are interpolated exactly as `np.interp` does."""
+        cases = [
+            # (value, old_bounds, new_bounds)
+            (-5, [0, 100], [0, 1]),  # below the domain
+            (150, [0, 100], [0, 1]),  # above the domain
+            (0, [0, 100], [0, 1]),  # lower bound
+            (100, [0, 100], [0, 1]),  # upper bound
+            (0.3, [-1, 1], [0, 1]),
+            (np.int64(4_321), [1_234, 98_765], [0, 1]),
+            (0.7, [0, 1], [1, -1]),  # decreasing new domain
+            (4, [5, 5], [0, 1]),  # degenerate domain, below
+            (5, [5, 5], [0, 1]),  # degenerate domain, at
+            (6, [5, 5], [0, 1]),  # degenerate domain, above
+        ]
+        for value, old_bounds, new_bounds in cases:
+            with self.subTest(value=value, old_bounds=old_bounds):
+                interpolated = interpolate(value, old_bounds, new_bounds)
+                self.assertIsInstance(interpolated, float)
+                self.assertEqual(interpolated,
+                                 np.interp(value, old_bounds, new_bounds))
+
     def test_interpolate_array(self):
         """Interpolate arrays of values."""
         # Interpolate from [ [0, 100]^3 ] to [ [0,1]^3 ].
@@ -70,6 +92,44 @@ class TestInterpolate(unittest.TestCase):
             self.assertLessEqual(k, new_bounds[i][1])
             self.assertAlmostEqual(k, expected[i])
 
+    def test_interpolate_array_interp(self):
+        """Arrays are interpolated exactly as `np.interp` on each element."""
+        value = [-5, 150, 0, 100, 4, 5, 6, 0.3]
+        old_bounds = [ [0, 100], [0, 100], [0, 100], [0, 100],
+                       [5, 5], [5, 5], [5, 5], [-1, 1] ]
+        new_bounds = [ [0, 1], [0, 1], [-1, 1], [-1, 1],
+                       [0, 1], [0, 1], [0, 1], [1, -1] ]
+        interpolated = interpolate(value, old_bounds, new_bounds)
+        # Below, above, lower bound, upper bound, zero-width domain (below,
+        # at, above), and a decreasing new domain.
+        expected = [0, 1, -1, 1, 0, 1, 1, -0.3]
+        for i, k in enumerate(interpolated):
+            with self.subTest(i=i):
+                self.assertEqual(k, np.interp(value[i], old_bounds[i],
+                                              new_bounds[i]))
+                self.assertAlmostEqual(k, expected[i])
+
+        # Random values and domains, including values outside of the domain.
+        rng = np.random.default_rng(42)
+        size = 10_000
+        old_low = rng.uniform(-100, 100, size)
+        old_high = old_low + rng.uniform(0, 100, size)
+        new_low = rng.uniform(-10, 10, size)
+        new_high = rng.uniform(-10, 10, size)
+        value = rng.uniform(old_low - 10, old_high + 10)
+        old_bounds = np.stack([old_low, old_high], axis=1)
+        new_bounds = np.stack([new_low, new_high], axis=1)
+        interpolated = interpolate(value, old_bounds, new_bounds)
+        expected = [
+            np.interp(value[i], old_bounds[i], new_bounds[i])
+            for i in range(size)
+        ]
+        np.testing.assert_array_equal(interpolated, expected)
+        # The scalar path gives the same results.
+        for i in range(0, size, 100):
+            self.assertEqual(interpolate(value[i], old_bounds[i], new_bounds[i]),
+                             interpolated[i])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,7 @@
 import unittest
+from unittest import mock
+
+import numpy as np
 
 from smartgrid import make_basic_smartgrid
 from algorithms.naive import RandomModel
@@ -22,6 +25,50 @@ class TestModels(unittest.TestCase):
             obs, rewards, _, _, infos = env.step(actions)
         env.close()
 
+    def test_random_model_actions(self):
+        env = make_basic_smartgrid()
+        obs, _ = env.reset(seed=123)
+
+        model = RandomModel(env.unwrapped, {'seed': 42})
+        actions = model.forward(obs)
+        self.assertEqual(set(actions.keys()), set(env.agents))
+        for agent_name, action in actions.items():
+            self.assertTrue(env.action_space(agent_name).contains(action))
+
+        # The same seed gives the same actions.
+        other_model = RandomModel(env.unwrapped, {'seed': 42})
+        other_actions = other_model.forward(obs)
+        for agent_name in env.agents:
+            np.testing.assert_array_equal(actions[agent_name],
+                                          other_actions[agent_name])
+        env.close()
+
+    def test_random_model_no_hyperparameters(self):
+        env = make_basic_smartgrid()
+        obs, _ = env.reset(seed=123)
+        model = RandomModel(env.unwrapped, None)
+        actions = model.forward(obs)
+        self.assertEqual(len(actions), env.unwrapped.num_agents)
+        env.close()
+
+    def test_random_model_fallback(self):
+        env = make_basic_smartgrid()
+        obs, _ = env.reset(seed=123)
+        # Force the per-agent sampling, as if spaces could not be stacked.
+        with mock.patch.object(RandomModel, '_can_stack', return_value=False):
+            model = RandomModel(env.unwrapped, {'seed': 42})
+            other_model = RandomModel(env.unwrapped, {'seed': 42})
+        actions = model.forward(obs)
+        other_actions = other_model.forward(obs)
+        for agent_name in env.agents:
+            space = env.action_space(agent_name)
+            self.assertTrue(space.contains(actions[agent_name]))
+            np.testing.assert_array_equal(actions[agent_name],
+                                          other_actions[agent_name])
+            # The env's own spaces are not used (nor reseeded).
+            self.assertIsNot(model._spaces[agent_name], space)
+        env.close()
+
     def test_qsom_model(self):
         env = make_basic_smartgrid()
 
@@ -38,6 +85,7 @@ class TestModels(unittest.TestCase):
             'q_discount_factor': 0.9,
             'update_all': True,
             'use_neighborhood': True,
+            'max_experiences': 5,
         }
         model = QSOM(env.unwrapped, hyperparams)
         obs, _ = env.reset(seed=123)
@@ -47,6 +95,46 @@ class TestModels(unittest.TestCase):
             actions = model.forward(obs)
             obs, rewards, _, _, infos = env.step(actions)
             model.backward(obs, rewards)
+        for agent in model.qsom_agents.values():
+            self.assertEqual(len(agent.experiences), 5)
+        env.close()
+
+    def test_qsom_som_dtype(self):
+        env = make_basic_smartgrid()
+        model = QSOM(env.unwrapped, {'som_dtype': 'float32'})
+        for agent in model.qsom_agents.values():
+            self.assertEqual(agent.state_som.units.dtype, np.float32)
+            self.assertEqual(agent.action_som.units.dtype, np.float32)
+
+        obs, _ = env.reset(seed=123)
+        for step in range(3):
+            actions = model.forward(obs)
+            obs, rewards, _, _, infos = env.step(actions)
+            model.backward(obs, rewards)
+        for agent in model.qsom_agents.values():
+            self.assertEqual(agent.state_som.units.dtype, np.float32)
+        env.close()
+
+    def test_qsom_partial_hyperparameters(self):
+        env = make_basic_smartgrid()
+
+        # Only override a single hyperparameter, the others use the defaults.
+        model = QSOM(env.unwrapped, {'q_learning_rate': 0.1})
+        self.assertEqual(model.hyper_parameters['q_learning_rate'], 0.1)
+        for name, value in QSOM.default_hyperparameters.items():
+            if name != 'q_learning_rate':
+                self.assertEqual(model.hyper_parameters[name], value)
+        # Agents keep the default number of experiences.
+        for agent in model.qsom_agents.values():
+            self.assertEqual(agent.experiences.maxlen,
+                             QSOM.default_hyperparameters['max_experiences'])
+        # The defaults themselves must not be modified.
+        self.assertEqual(QSOM.default_hyperparameters['q_learning_rate'], 0.7)
+
+        obs, _ = env.reset(seed=123)
+        actions = model.forward(obs)
+        obs, rewards, _, _, infos = env.step(actions)
+        model.backward(obs, rewards)
         env.close()
 
 
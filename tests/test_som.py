@@ -0,0 +1,36 @@
+import unittest
+
+import numpy as np
+
+from algorithms.qsom.som import SOM
+
+
+class DecayingSOM(SOM):
+    """SOM whose sigma (and learning rate) decay at each step."""
+
+    def _decay(self, value, step):
+        return value * 0.999 ** step
+
+
+class TestSOM(unittest.TestCase):
+
+    def test_neighborhood_cache(self):
+        som = SOM(3, 3, 2)
+        # The same (cached) matrix is returned for the same center.
+        self.assertIs(som.neighborhood(4), som.neighborhood(4))
+        np.testing.assert_array_equal(som.neighborhood(4),
+                                      som._gaussian(som.coords_map[4], som.sigma))
+
+    def test_neighborhood_cache_decay(self):
+        som = DecayingSOM(3, 3, 2)
+        for _ in range(100):
+            data = np.random.rand(2)
+            som.update(data, som.compute_winner_node(data))
+            # Only the matrices for the current sigma are kept.
+            self.assertLessEqual(len(som._neighborhoods), som.nb_units)
+        np.testing.assert_array_equal(som.neighborhood(0),
+                                      som._gaussian(som.coords_map[0], som.sigma))
+
+
+if __name__ == '__main__':
+    unittest.main()